@@ -15,6 +15,7 @@ const double MM_PER_PULSE = 0.00005080;  // 20 TPI = 0.05in/rev = 1.27mm/rev, 25
 double currentPosition= -999; // -999 to indicate null value
 unsigned long lastPositionUpdate = 0;
 const int STEPS_PER_COMMAND = 20;
+const unsigned long JOG_TIMEOUT_MS = 300;  // Stop jogging if START isn't re-sent within this
 
 // --------------------------
 // Flags
@@ -23,6 +24,8 @@ volatile bool contactDetected = false;
 volatile bool forceRest = false;
 bool isCalibrated = false;
 bool manualControlActive = false;
+int manualJogDirection = 0;    // 1 = CW, -1 = CCW, 0 = stopped
+unsigned long lastJogCommand = 0;  // millis() of the last START/keepalive
 
 
 // --------------------------
@@ -60,6 +63,7 @@ void loop() {
     }
     else if (command == "MANUAL:COMPLETE") {
       manualControlActive = false;
+      manualJogDirection = 0;
       Serial.println("STATUS:MANUAL_COMPLETE");
     }
     else if (command == "MANUAL:CW" && manualControlActive) {
@@ -68,16 +72,37 @@ void loop() {
     else if (command == "MANUAL:CCW" && manualControlActive) {
       manualStepCCW();
     }
+    else if (command == "MANUAL:CW_START" && manualControlActive) {
+      manualJogDirection = 1;
+      lastJogCommand = millis();
+    }
+    else if (command == "MANUAL:CCW_START" && manualControlActive) {
+      manualJogDirection = -1;
+      lastJogCommand = millis();
+    }
     else if (command == "MANUAL:STOP") {
       manualStopMotor();
     }
     else if (command == "REST") {
+      manualJogDirection = 0;
       stopMotor();
     }
     else {
       Serial.println("Unknown command: " + command);
     }
   }
+
+  // Keep jogging between START and STOP commands. The GUI re-sends START
+  // while the key is held; stop on our own if it goes quiet (lost link/crash)
+  if (manualJogDirection != 0 && millis() - lastJogCommand > JOG_TIMEOUT_MS) {
+    manualStopMotor();
+  }
+  if (manualControlActive && manualJogDirection == 1) {
+    manualStepCW();
+  }
+  else if (manualControlActive && manualJogDirection == -1) {
+    manualStepCCW();
+  }
 }
 
 // --------------------------
@@ -176,6 +201,7 @@ void moveToTarget(float mm) {
 // --------------------------
 void manualStepCCW() {
   if (!isCalibrated) {
+    manualJogDirection = 0;
     Serial.println("ERROR:NOT_CALIBRATED");
     return;
   }
@@ -187,6 +213,7 @@ void manualStepCCW() {
   contactDetected = false;
   if (digitalRead(contactPin) == LOW) {
     contactDetected = true;
+    manualJogDirection = 0;
     Serial.println("WARNING: Contact already detected!");
     return;
   }
@@ -196,6 +223,7 @@ void manualStepCCW() {
     // Check for contact during steps
     if (digitalRead(contactPin) == LOW) {
       contactDetected = true;
+      manualJogDirection = 0;
       Serial.println("WARNING: Contact detected during movement!");
       break;
     }
@@ -207,6 +235,7 @@ void manualStepCCW() {
 
 void manualStepCW() {
   if (!isCalibrated) {
+    manualJogDirection = 0;
     Serial.println("ERROR:NOT_CALIBRATED");
     return;
   }
@@ -222,6 +251,7 @@ void manualStepCW() {
 }
 
 void manualStopMotor() {
+  manualJogDirection = 0;
   Serial.print("POSITION:");
   Serial.println(currentPosition, 6);
 }
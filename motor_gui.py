@@ -1,38 +1,67 @@
-from transitions import Machine
 import customtkinter as ctk
 import serial
 import threading
 import time
+import queue
+import collections
 import serial.tools.list_ports
 
 # -----------------------
 # Arduino Serial Setup
 # -----------------------
 BAUD_RATE = 9600
+POSITION_EPSILON = 1e-6        # Position changes smaller than this (mm) are ignored
+POSITION_EMIT_INTERVAL = 0.05  # Minimum seconds between position notifications
+MAX_QUEUED_POSITIONS = 2048    # Oldest POSITION log lines are dropped past this
+
+# Pre-encoded fixed commands (TARGET is formatted per call via send_command)
+CMD_CALIBRATE = b"CALIBRATE\n"
+CMD_REST = b"REST\n"
+CMD_MANUAL_READY = b"MANUAL:READY\n"
+CMD_MANUAL_CW_START = b"MANUAL:CW_START\n"
+CMD_MANUAL_CCW_START = b"MANUAL:CCW_START\n"
+CMD_MANUAL_STOP = b"MANUAL:STOP\n"
+CMD_MANUAL_COMPLETE = b"MANUAL:COMPLETE\n"
+
+# Manual jog START is re-sent at this interval while held; the Arduino stops
+# the motor by itself if it hears nothing for JOG_TIMEOUT_MS (300 ms)
+MANUAL_KEEPALIVE_MS = 100
+
+# -----------------------
+# Communication Log Limits
+# -----------------------
+LOG_MAX_LINES = 1000   # Trim the log once it grows past this many lines
+LOG_TRIM_LINES = 100   # Number of oldest lines removed per trim
 
 # -----------------------
 # Observer Pattern Implementation
 # -----------------------
 class Observer:
-    def update(self, subject, *args, **kwargs):
+    def update(self, subject, event=None, position=None, status=None,
+               port=None, error=None, state=None):
         pass
 
 class Subject:
     def __init__(self):
-        self._observers = []
+        # Immutable snapshot: attach/detach swap in a new tuple, so notify can
+        # iterate it from any thread without locking
+        self._observers = ()
     
     def attach(self, observer):
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers = self._observers + (observer,)
     
     def detach(self, observer):
-        try:
-            self._observers.remove(observer)
-        except ValueError:
-            pass
+        self._observers = tuple(o for o in self._observers if o is not observer)
     
     def notify(self, *args, **kwargs):
-        for observer in self._observers:
+        # A single attribute load is the whole snapshot
+        observers = self._observers
+        # Fast path for the common single-observer case
+        if len(observers) == 1:
+            observers[0].update(self, *args, **kwargs)
+            return
+        for observer in observers:
             observer.update(self, *args, **kwargs)
 
 # -----------------------
@@ -41,26 +70,71 @@ class Subject:
 class MotorController(Subject):
     states = ['Rest', 'Calibration', 'Manual Control', 'Target Distance']
 
+    # (source state, trigger) -> destination state
+    _transitions = {
+        ('Rest', 'start_calibration'): 'Calibration',
+        ('Rest', 'target_move'): 'Target Distance',
+        ('Rest', 'manual_mode'): 'Manual Control',
+    }
+    # go_rest is allowed from every state
+    _transitions.update({(state, 'go_rest'): 'Rest' for state in states})
+
     def __init__(self, serial_port=None):
         Subject.__init__(self)
-        self.machine = Machine(model=self, states=MotorController.states, initial='Rest')
-        self.machine.add_transition(trigger='start_calibration', source='Rest', dest='Calibration', 
-                                   before='notify_state_change_before', after='calibrate')
-        self.machine.add_transition(trigger='target_move', source='Rest', dest='Target Distance', 
-                                   before='notify_state_change_before', after='move_to_target')
-        self.machine.add_transition(trigger='manual_mode', source='Rest', dest='Manual Control', 
-                                   before='notify_state_change_before', after='manual_control')
-        self.machine.add_transition(trigger='go_rest', source='*', dest='Rest', 
-                                   before='notify_state_change_before', after='on_rest')
+        self.state = 'Rest'
 
         self.serial_port = serial_port
         self.serial_conn = None
-        self.message_queue = []  # Initialize the message queue
+        self.message_queue = queue.SimpleQueue()  # Serial thread -> GUI thread
+        # High-rate POSITION lines go to a bounded ring buffer instead, so a
+        # stalled GUI can't grow memory without limit; other messages are never dropped
+        self.position_queue = collections.deque(maxlen=MAX_QUEUED_POSITIONS)
+        # Lines queued so far; each entry is stamped with its sequence number so
+        # the GUI can restore arrival order across the two queues
+        self.queued_count = 0
         self.position_mm = -999  # Initialize position
-        self.listening = False
+        self._last_position_emit = 0.0  # time.monotonic() of last position notify
+        self._position_pending = False  # Position changed but not yet notified
+        self._stop_evt = threading.Event()  # Set to stop the listener thread
         self.listen_thread = None
+
+        # Arduino message prefix -> handler
+        self._handlers = {
+            b"ERROR": self._on_error,
+            b"WARNING": self._on_warning,
+            b"STATUS": self._on_status,
+            b"POSITION": self._on_position,
+        }
+        # STATUS payloads that mark the end of a motor operation
+        self._status_handlers = {
+            b"CALIBRATION_COMPLETE": self._on_operation_finished,
+            b"CALIBRATION_TIMEOUT": self._on_operation_finished,
+            b"TARGET_COMPLETE": self._on_operation_finished,
+            b"MANUAL_COMPLETE": self._on_operation_finished,
+        }
         self.connect_to_arduino()
     
+    def _trigger(self, trigger, after):
+        """Move to the state mapped from (current state, trigger), then run after()"""
+        dest = self._transitions.get((self.state, trigger))
+        if dest is None:
+            raise RuntimeError(f"Can't trigger event {trigger} from state {self.state}!")
+        self.notify_state_change_before()
+        self.state = dest
+        after()
+
+    def start_calibration(self):
+        self._trigger('start_calibration', self.calibrate)
+
+    def target_move(self):
+        self._trigger('target_move', self.move_to_target)
+
+    def manual_mode(self):
+        self._trigger('manual_mode', self.manual_control)
+
+    def go_rest(self):
+        self._trigger('go_rest', self.on_rest)
+
     def notify_state_change_before(self):
         """Notify observers before state change"""
         self.notify(event='before_state_change', state=self.state)
@@ -72,17 +146,22 @@ class MotorController(Subject):
     def connect_to_arduino(self):
         # Close existing connection if any
         if self.serial_conn and self.serial_conn.is_open:
-            self.listening = False
-            if self.listen_thread and self.listen_thread.is_alive():
-                self.listen_thread.join(timeout=1.0)
+            self.stop_listening()
             self.serial_conn.close()
             
         try:
-            self.serial_conn = serial.Serial(self.serial_port, BAUD_RATE, timeout=1)
+            self.serial_conn = serial.Serial(self.serial_port, BAUD_RATE, timeout=0.1)
+            try:
+                # Cut USB-serial kernel buffering latency where supported
+                self.serial_conn.set_low_latency_mode(True)
+            except Exception:
+                pass  # Not available on this platform/driver
             time.sleep(2)
             
-            self.listening = True
-            self.listen_thread = threading.Thread(target=self.listen_to_arduino, daemon=True)
+            # Fresh event per connection so a lingering old thread stays stopped
+            self._stop_evt = threading.Event()
+            self.listen_thread = threading.Thread(target=self.listen_to_arduino,
+                                                  args=(self._stop_evt,), daemon=True)
             self.listen_thread.start()
             
             # Notify of successful connection
@@ -99,91 +178,132 @@ class MotorController(Subject):
         return self.connect_to_arduino()
 
     def send_command(self, cmd):
+        self.send_bytes((cmd + '\n').encode('utf-8'))
+
+    def send_bytes(self, data):
+        """Write an already-encoded, newline-terminated command"""
         if self.serial_conn and self.serial_conn.is_open:
-            self.serial_conn.write((cmd + '\n').encode('utf-8'))
+            self.serial_conn.write(data)
 
-    def listen_to_arduino(self):
+    def stop_listening(self):
+        """Stop the listener thread, waking it from any in-progress read"""
+        self._stop_evt.set()
+        if self.serial_conn and self.serial_conn.is_open:
+            try:
+                self.serial_conn.cancel_read()
+            except Exception:
+                pass  # Nothing to cancel; the read timeout still applies
+        if self.listen_thread and self.listen_thread.is_alive():
+            self.listen_thread.join(timeout=0.5)
+
+    def listen_to_arduino(self, stop_evt):
         # Continuously listen for messages from Arduino
-        while self.listening and self.serial_conn and self.serial_conn.is_open:
+        while not stop_evt.is_set() and self.serial_conn and self.serial_conn.is_open:
             try:
-                if self.serial_conn.in_waiting:
-                    message = self.serial_conn.readline().decode('utf-8').strip()
-                    if message:
-                        # Add to message queue for GUI updates
-                        self.message_queue.append(message)
-                        
-                        # Handle error messages
-                        if message.startswith("ERROR:"):
-                            error = message.split(":", 1)[1]
-                            if self.state != 'Rest':
-                                self.go_rest()
-                                # Notify of state change
-                                self.notify_state_change_after()
-
-                        # Handle warning messages
-                        elif message.startswith("WARNING:"):
-                            warning = message.split(":", 1)[1]
-                            print(f"Warning from Arduino: {warning}")
-
-                        # Handle status messages
-                        elif message.startswith("STATUS:"):
-                            status = message.split(":", 1)[1]
-                            if status == "CALIBRATION_COMPLETE":
-                                # Important: We're in a different thread here
-                                if self.state != 'Rest':
-                                    self.go_rest()
-                                    # Explicitly notify of state change
-                                    self.notify_state_change_after()
-                            elif status == "CALIBRATION_TIMEOUT":
-                                if self.state != 'Rest':
-                                    self.go_rest()
-                                    self.notify_state_change_after()
-                            elif status == "TARGET_COMPLETE":
-                                if self.state != 'Rest':
-                                    self.go_rest()
-                                    self.notify_state_change_after()
-                            elif status == "MANUAL_COMPLETE":
-                                if self.state != 'Rest':
-                                    self.go_rest()
-                                    self.notify_state_change_after()
-                            
-                        # Handle position updates
-                        elif message.startswith("POSITION:"):
-                            try:
-                                position_value = message.split(":", 1)[1].strip()
-                                self.position_mm = float(position_value)
-                                # Notify observers of position change
-                                self.notify(event='position_update', position=self.position_mm)
-                            except Exception as e:
-                                print(f"Error processing position update: {e}")
+                # Blocks until a full line arrives or the read timeout expires
+                raw = self.serial_conn.readline()
+                if not raw:
+                    # Quiet line: publish any rate-limited position update
+                    self._flush_position()
+                    continue
+                # Stay in bytes here; the GUI decodes when it logs the message
+                raw = raw.strip()
+                if raw:
+                    tag, _, payload = raw.partition(b":")
+
+                    # Add to message queue (with sequence and receive time) for GUI updates
+                    entry = (self.queued_count, time.strftime('%H:%M:%S'), raw)
+                    if tag == b"POSITION":
+                        self.position_queue.append(entry)
+                    else:
+                        self.message_queue.put_nowait(entry)
+                    # Publish the count only after the entry is queued
+                    self.queued_count += 1
+                    self.notify('message_received')
+
+                    # Dispatch on the "TAG:" prefix
+                    handler = self._handlers.get(tag)
+                    if handler:
+                        handler(payload)
 
             except Exception as e:
                 print(f"Error reading from Arduino: {e}")
-            time.sleep(0.01)
+                stop_evt.wait(0.1)  # Back off instead of spinning on a failed port
+
+    def _on_error(self, error):
+        self._flush_position()
+        if self.state != 'Rest':
+            self.go_rest()
+            # Notify of state change
+            self.notify_state_change_after()
+
+    def _on_warning(self, warning):
+        print(f"Warning from Arduino: {warning.decode('utf-8', 'replace').strip()}")
+
+    def _on_status(self, status):
+        self._flush_position()
+        handler = self._status_handlers.get(status)
+        if handler:
+            handler()
+
+    def _on_operation_finished(self):
+        # Important: We're in the listener thread here
+        if self.state != 'Rest':
+            self.go_rest()
+            # Explicitly notify of state change
+            self.notify_state_change_after()
+
+    def _on_position(self, position_value):
+        try:
+            # float() parses ASCII bytes directly and ignores surrounding whitespace
+            new_position = float(position_value)
+        except Exception as e:
+            print(f"Error processing position update: {e}")
+            return
+        
+        now = time.monotonic()
+        
+        # Skip unchanged positions (common while the motor is idle), but still
+        # publish a held-back value once the interval has passed; repeated lines
+        # keep readline() from timing out, so _flush_position may not run otherwise
+        if abs(new_position - self.position_mm) < POSITION_EPSILON:
+            if self._position_pending and now - self._last_position_emit >= POSITION_EMIT_INTERVAL:
+                self._emit_position(now)
+            return
+        self.position_mm = new_position
+        
+        # Rate-limit notifications; the latest value is flushed later
+        if now - self._last_position_emit < POSITION_EMIT_INTERVAL:
+            self._position_pending = True
+            return
+        self._emit_position(now)
+    
+    def _emit_position(self, now):
+        self._position_pending = False
+        self._last_position_emit = now
+        # Notify observers of position change
+        self.notify('position_update', self.position_mm)
+    
+    def _flush_position(self):
+        """Notify observers of a position update held back by the rate limit"""
+        if self._position_pending:
+            self._emit_position(time.monotonic())
 
     def calibrate(self):
-        def task():
-            self.send_command("CALIBRATE")
-        threading.Thread(target=task, daemon=True).start()
+        self.send_bytes(CMD_CALIBRATE)
 
     def move_to_target(self):
-        def task():
-            if hasattr(self, 'target_distance') and self.target_distance is not None:
-                self.send_command(f"TARGET:{self.target_distance:.6f}")
-            else:
-                self.go_rest()
-                self.notify_state_change_after()
-        threading.Thread(target=task, daemon=True).start()
+        if hasattr(self, 'target_distance') and self.target_distance is not None:
+            self.send_command(f"TARGET:{self.target_distance:.6f}")
+        else:
+            self.go_rest()
+            self.notify_state_change_after()
 
     def manual_control(self):
-        def task():
-            self.send_command("MANUAL:READY")
-        threading.Thread(target=task, daemon=True).start()
+        self.send_bytes(CMD_MANUAL_READY)
 
     def on_rest(self):
-        def task():
-            self.send_command("REST")
-        threading.Thread(target=task, daemon=True).start()
+        self.send_bytes(CMD_REST)
         # Explicitly notify after entering rest state
         self.notify_state_change_after()
 
@@ -199,10 +319,27 @@ def get_available_ports():
 # GUI Definition
 # -----------------------
 class MotorApp(ctk.CTk, Observer):
+    # Control button appearance when enabled (normal colors with hover effect)
+    _CFG_ON = {
+        "state": "normal",
+        "fg_color": "#1f538d",
+        "hover_color": "#14365d",
+        "text_color": "white"
+    }
+    # Control button appearance when disabled (gray colors with no hover)
+    _CFG_OFF = {
+        "state": "disabled",
+        "fg_color": "#565B5E",
+        "text_color": "gray70"
+    }
+
     def __init__(self):
         ctk.CTk.__init__(self)
         Observer.__init__(self)
         
+        self._drain_scheduled = False  # True while a drain_queue call is pending
+        self._drain_carry = []  # Queued entries held back until earlier ones arrive
+        self._controls_enabled = None  # Last state applied by enable_controls
         self.controller = MotorController()
         self.controller.attach(self)  # Register as observer
         
@@ -224,6 +361,8 @@ class MotorApp(ctk.CTk, Observer):
                                          variable=self.port_var, 
                                          width=200)
         self.port_combo.pack(side="left", padx=5)
+        self._port_displays = None  # Values currently shown in port_combo
+        self._port_scan_thread = None
         
         # Button appearance configuration for top controls
         top_button_config = {
@@ -337,23 +476,40 @@ class MotorApp(ctk.CTk, Observer):
         self.log = ctk.CTkTextbox(self, width=350, height=150)
         self.log.pack(pady=5, padx=20, fill="both", expand=True)
 
+        # Build dialogs once; they are shown/hidden on demand
+        self._build_safety_dialog()
+        self._build_target_dialog()
+        self._build_manual_popup()
+
         # Initialize port list
         self.refresh_ports()
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.update_loop()
     
     def refresh_ports(self):
-        """Refresh the list of available serial ports"""
+        """Refresh the list of available serial ports without blocking the UI"""
+        # Ignore repeated clicks while a scan is already running
+        if self._port_scan_thread and self._port_scan_thread.is_alive():
+            return
+        self._port_scan_thread = threading.Thread(target=self._enum_ports, daemon=True)
+        self._port_scan_thread.start()
+    
+    def _enum_ports(self):
+        # Runs in a worker thread; port enumeration can take a while
         ports = get_available_ports()
-        
-        # Clear existing values
-        self.port_combo.configure(values=[])
+        self.after(0, self._apply_ports, ports)
+    
+    def _apply_ports(self, ports):
+        """Show the enumerated ports in the dropdown (main thread)"""
+        # Extract display values for combobox
+        port_displays = [display for _, display in ports]
+        
+        # Skip reconfiguring the combobox when the list hasn't changed
+        if port_displays != self._port_displays:
+            self._port_displays = port_displays
+            self.port_combo.configure(values=port_displays)
         
         if ports:
-            # Extract display values for combobox
-            port_displays = [display for _, display in ports]
-            self.port_combo.configure(values=port_displays)
             self.port_combo.set(port_displays[0])
             self.log_msg(f"Found {len(ports)} serial ports")
         else:
@@ -385,82 +541,53 @@ class MotorApp(ctk.CTk, Observer):
     
     def enable_controls(self, enabled=True):
         """Enable or disable control buttons based on connection status"""
+        # Skip if the buttons already reflect the requested state
+        if self._controls_enabled == enabled:
+            return
+        self._controls_enabled = enabled
+        
         # In CustomTkinter, we need to fully configure the button appearance
         # for each state to ensure proper hover effects
-        
-        if enabled:
-            # When enabled, set normal colors with hover effect
-            self.calibrate_button.configure(
-                state="normal",
-                fg_color="#1f538d",
-                hover_color="#14365d",
-                text_color="white"
-            )
-            self.manual_button.configure(
-                state="normal",
-                fg_color="#1f538d",
-                hover_color="#14365d", 
-                text_color="white"
-            )
-            self.target_button.configure(
-                state="normal",
-                fg_color="#1f538d",
-                hover_color="#14365d",
-                text_color="white"
-            )
-            self.rest_button.configure(
-                state="normal",
-                fg_color="#1f538d",
-                hover_color="#14365d",
-                text_color="white"
-            )
-        else:
-            # When disabled, use gray colors with no hover
-            disabled_color = "#565B5E"
-            self.calibrate_button.configure(
-                state="disabled",
-                fg_color=disabled_color,
-                text_color="gray70"
-            )
-            self.manual_button.configure(
-                state="disabled",
-                fg_color=disabled_color,
-                text_color="gray70"
-            )
-            self.target_button.configure(
-                state="disabled",
-                fg_color=disabled_color,
-                text_color="gray70"
-            )
-            self.rest_button.configure(
-                state="disabled",
-                fg_color=disabled_color,
-                text_color="gray70"
-            )
-
-    def update(self, subject, event=None, **kwargs):
+        cfg = self._CFG_ON if enabled else self._CFG_OFF
+        for button in (self.calibrate_button, self.manual_button,
+                       self.target_button, self.rest_button):
+            button.configure(**cfg)
+
+    def update(self, subject, event=None, position=None, status=None,
+               port=None, error=None, state=None):
         """Handle updates from the observed controller"""
         if event == 'before_state_change' or event == 'after_state_change':
-            # Use after(0) to ensure UI updates happen in the main thread
-            self.after(0, lambda: self.update_state_display(subject.state))
+            # Use after(0) to ensure UI updates happen in the main thread;
+            # the state is read when the callback runs, as before
+            self.after(0, self.show_controller_state)
             
         elif event == 'position_update':
             # Update position display
-            position = kwargs.get('position', -999)
-            self.after(0, lambda: self.update_position_display(position))
+            self.after(0, self.update_position_display, position)
+        
+        elif event == 'message_received':
+            # Wake the main thread only when there is something to log;
+            # one pending drain covers any messages that arrive before it runs
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.after_idle(self.drain_queue)
         
         elif event == 'connection_update':
-            status = kwargs.get('status')
             if status == 'connected':
-                port = kwargs.get('port', 'unknown')
-                self.after(0, lambda: self.status_label.configure(
-                    text=f"Connected to {port}", text_color="#00FF00"))
-                self.after(0, lambda: self.enable_controls(True))
+                self.after(0, self._set_status, f"Connected to {port}", "#00FF00")
+                self.after(0, self.enable_controls, True)
             elif status == 'failed':
-                error = kwargs.get('error', 'unknown error')
-                self.after(0, lambda: self.status_label.configure(
-                    text=f"Connection failed: {error}", text_color="#FF5555"))
-                self.after(0, lambda: self.enable_controls(False))
+                error = error or 'unknown error'
+                self.after(0, self._set_status, f"Connection failed: {error}", "#FF5555")
+                self.after(0, self.enable_controls, False)
+    
+    def _set_status(self, text, color):
+        """Update the connection status label"""
+        self.status_label.configure(text=text, text_color=color)
+    
+    def show_controller_state(self):
+        """Show the controller's current state in the UI"""
+        self.update_state_display(self.controller.state)
     
     def update_state_display(self, state):
         """Update the state display in the UI"""
@@ -478,63 +605,157 @@ class MotorApp(ctk.CTk, Observer):
     def on_closing(self):
         self.controller.go_rest()
         # Clean up the serial listener thread
-        if hasattr(self.controller, 'listening'):
-            self.controller.listening = False
-            if hasattr(self.controller, 'listen_thread'):
-                self.controller.listen_thread.join(timeout=1.0)
+        self.controller.stop_listening()
         self.destroy()  # Close the main window
 
     def log_msg(self, msg):
-        self.log.insert("end", f"[{time.strftime('%H:%M:%S')}] {msg}\n")
+        self.append_log(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
+
+    def append_log(self, text):
+        """Insert text into the log in one call and keep its length bounded"""
+        self.log.insert("end", text)
+        line_count = int(self.log.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            # Drop the oldest lines, in chunks so trimming isn't done every insert
+            excess = line_count - LOG_MAX_LINES + LOG_TRIM_LINES
+            self.log.delete("1.0", f"{excess + 1}.0")
         self.log.see("end")
 
-    def update_loop(self):
-        # Process any messages in the queue (just for logging)
-        if self.controller.message_queue:
-            messages = self.controller.message_queue.copy()
-            self.controller.message_queue.clear()
-            
-            # Log the messages
-            for message in messages:
-                self.log_msg(f"<- Received: {message}")
+    def drain_queue(self):
+        # Clear the flag first so messages queued during the drain schedule another
+        self._drain_scheduled = False
         
-        self.after(100, self.update_loop)  # More frequent updates
-
-    def on_calibrate(self):
+        # Every entry numbered below this is already in one of the queues
+        cutoff = self.controller.queued_count
+        
+        # Drain any messages in the queues (just for logging)
+        entries = self._drain_carry
+        positions = self.controller.position_queue
+        while True:
+            try:
+                entries.append(positions.popleft())
+            except IndexError:
+                break
+        while True:
+            try:
+                entries.append(self.controller.message_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Restore arrival order. Entries queued while draining may have gaps
+        # before them in the other queue, so hold them for the next drain
+        entries.sort()
+        ready = 0
+        while ready < len(entries) and entries[ready][0] < cutoff:
+            ready += 1
+        self._drain_carry = entries[ready:]
+        
+        lines = [f"[{timestamp}] <- Received: {message.decode('utf-8', 'replace')}\n"
+                 for _, timestamp, message in entries[:ready]]
+        
+        # Log the whole batch with a single insert
+        if lines:
+            self.append_log("".join(lines))
+
+    def _show_dialog(self, dialog):
+        """Show a prebuilt dialog as a modal window"""
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _hide_dialog(self, dialog):
+        """Hide a prebuilt dialog so it can be shown again later"""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _build_safety_dialog(self):
         # Create a simple dialog with safety checks
-        safety_dialog = ctk.CTkToplevel(self)
-        safety_dialog.title("Safety Checks")
-        safety_dialog.geometry("450x200")
-        safety_dialog.transient(self)
-        safety_dialog.grab_set()
+        self._safety_dialog = ctk.CTkToplevel(self)
+        self._safety_dialog.title("Safety Checks")
+        self._safety_dialog.geometry("450x200")
+        self._safety_dialog.transient(self)
+        self._safety_dialog.withdraw()
         
-        ctk.CTkLabel(safety_dialog, 
+        ctk.CTkLabel(self._safety_dialog, 
                     text="Safety Confirmation Required:", 
                     font=("Arial", 14, "bold")).pack(pady=(15, 5))
         
-        check1 = ctk.CTkCheckBox(safety_dialog, text="High voltage wires disconnected from electrodes")
-        check1.pack(anchor="w", padx=20, pady=5)
+        self._safety_check1 = ctk.CTkCheckBox(self._safety_dialog, text="High voltage wires disconnected from electrodes")
+        self._safety_check1.pack(anchor="w", padx=20, pady=5)
         
-        check2 = ctk.CTkCheckBox(safety_dialog, text="Pins 2 and 3 connected to electrodes")
-        check2.pack(anchor="w", padx=20, pady=5)
+        self._safety_check2 = ctk.CTkCheckBox(self._safety_dialog, text="Pins 2 and 3 connected to electrodes")
+        self._safety_check2.pack(anchor="w", padx=20, pady=5)
         
-        def on_confirm():
-            if check1.get() and check2.get():
-                safety_dialog.destroy()
-                self.controller.start_calibration()
-                self.log_msg("-> Sent: CALIBRATE") # Start calibration
-            else:
-                self.log_msg("Complete all safety checks to proceed")
+        button_frame = ctk.CTkFrame(self._safety_dialog)
+        button_frame.pack(pady=15)
         
-        def on_cancel():
-            safety_dialog.destroy()
-            self.log_msg("Calibration cancelled")
+        ctk.CTkButton(button_frame, text="Cancel", command=self._on_safety_cancel).pack(side="left", padx=10)
+        ctk.CTkButton(button_frame, text="Confirm & Start", command=self._on_safety_confirm).pack(side="left", padx=10)
         
-        button_frame = ctk.CTkFrame(safety_dialog)
+        self._safety_dialog.protocol("WM_DELETE_WINDOW", self._on_safety_cancel)
+
+    def _on_safety_confirm(self):
+        if self._safety_check1.get() and self._safety_check2.get():
+            self._hide_dialog(self._safety_dialog)
+            self.controller.start_calibration()
+            self.log_msg("-> Sent: CALIBRATE") # Start calibration
+        else:
+            self.log_msg("Complete all safety checks to proceed")
+
+    def _on_safety_cancel(self):
+        self._hide_dialog(self._safety_dialog)
+        self.log_msg("Calibration cancelled")
+
+    def on_calibrate(self):
+        # Start every calibration with the safety checks cleared
+        self._safety_check1.deselect()
+        self._safety_check2.deselect()
+        self._show_dialog(self._safety_dialog)
+
+    def _build_target_dialog(self):
+        self._target_dialog = ctk.CTkToplevel(self)
+        self._target_dialog.title("Set Target Position")
+        self._target_dialog.geometry("400x200")
+        self._target_dialog.transient(self)
+        self._target_dialog.withdraw()
+        
+        ctk.CTkLabel(self._target_dialog, 
+                    text="Enter Target Position (mm):", 
+                    font=("Arial", 14, "bold")).pack(pady=(15, 5))
+        
+        # Create entry field - no prefilling
+        self._target_entry = ctk.CTkEntry(self._target_dialog, width=200)
+        self._target_entry.pack(pady=10)
+        
+        # Add a label for error messages
+        self._target_result_label = ctk.CTkLabel(self._target_dialog, text="", text_color="red")
+        self._target_result_label.pack(pady=5)
+        
+        button_frame = ctk.CTkFrame(self._target_dialog)
         button_frame.pack(pady=15)
         
-        ctk.CTkButton(button_frame, text="Cancel", command=on_cancel).pack(side="left", padx=10)
-        ctk.CTkButton(button_frame, text="Confirm & Start", command=on_confirm).pack(side="left", padx=10)
+        ctk.CTkButton(button_frame, text="Cancel", command=self._on_target_cancel).pack(side="left", padx=10)
+        ctk.CTkButton(button_frame, text="Move to Target", command=self._on_target_confirm).pack(side="left", padx=10)
+        
+        self._target_dialog.protocol("WM_DELETE_WINDOW", self._on_target_cancel)
+
+    def _on_target_confirm(self):
+        try:
+            float_dist = float(self._target_entry.get())
+            if float_dist < 0:
+                self._target_result_label.configure(text="Distance must be a positive number.", text_color="red")
+                return
+                
+            self._hide_dialog(self._target_dialog)
+            self.controller.target_distance = float_dist
+            self.controller.target_move()
+            self.log_msg(f"-> Sent: TARGET:{float_dist}")
+            
+        except ValueError:
+            self._target_result_label.configure(text="Invalid target distance. Please enter a number.", text_color="red")
+
+    def _on_target_cancel(self):
+        self._hide_dialog(self._target_dialog)
+        self.log_msg("Target movement cancelled")
 
     def on_target(self):
         # First, check if system is calibrated
@@ -556,52 +777,130 @@ class MotorApp(ctk.CTk, Observer):
             ctk.CTkButton(calib_warning, text="OK", command=close_warning).pack(pady=10)
             return
         
-        # System is calibrated, show target input dialog
-        target_dialog = ctk.CTkToplevel(self)
-        target_dialog.title("Set Target Position")
-        target_dialog.geometry("400x200")
-        target_dialog.transient(self)
-        target_dialog.grab_set()
+        # System is calibrated, show target input dialog with no prefilling
+        self._target_entry.delete(0, "end")
+        self._target_result_label.configure(text="")
+        self._show_dialog(self._target_dialog)
         
-        ctk.CTkLabel(target_dialog, 
-                    text="Enter Target Position (mm):", 
-                    font=("Arial", 14, "bold")).pack(pady=(15, 5))
+        # Set focus to the entry field
+        self._target_entry.focus_set()
+
+    def _build_manual_popup(self):
+        self._manual_popup = ctk.CTkToplevel(self)
+        self._manual_popup.title("Manual Control")
+        self._manual_popup.geometry("300x180")
+        self._manual_popup.transient(self)
+        self._manual_popup.withdraw()
         
-        # Create entry field - no prefilling
-        target_entry = ctk.CTkEntry(target_dialog, width=200)
-        target_entry.pack(pady=10)
+        ctk.CTkLabel(self._manual_popup, 
+                    text="Hold arrow keys to move motor",
+                    font=("Arial", 14)).pack(pady=10)
         
-        def on_confirm():
-            try:
-                float_dist = float(target_entry.get())
-                if float_dist < 0:
-                    result_label.configure(text="Distance must be a positive number.", text_color="red")
-                    return
-                    
-                target_dialog.destroy()
-                self.controller.target_distance = float_dist
-                self.controller.target_move()
-                self.log_msg(f"-> Sent: TARGET:{float_dist}")
-                
-            except ValueError:
-                result_label.configure(text="Invalid target distance. Please enter a number.", text_color="red")
+        # Left and right buttons
+        button_frame = ctk.CTkFrame(self._manual_popup)
+        button_frame.pack(pady=10)
         
-        def on_cancel():
-            target_dialog.destroy()
-            self.log_msg("Target movement cancelled")
+        left_button = ctk.CTkButton(button_frame, text="◄", width=40, height=40)
+        left_button.pack(side="left", padx=10)
         
-        # Add a label for error messages
-        result_label = ctk.CTkLabel(target_dialog, text="", text_color="red")
-        result_label.pack(pady=5)
+        right_button = ctk.CTkButton(button_frame, text="►", width=40, height=40)
+        right_button.pack(side="left", padx=10)
         
-        button_frame = ctk.CTkFrame(target_dialog)
-        button_frame.pack(pady=15)
+        # For key tracking
+        self._manual_keys_pressed = {"left": False, "right": False}
+        self._manual_jog_command = None  # START command currently being held
+        self._manual_jog_timer = None  # after() id of the pending keepalive
         
-        ctk.CTkButton(button_frame, text="Cancel", command=on_cancel).pack(side="left", padx=10)
-        ctk.CTkButton(button_frame, text="Move to Target", command=on_confirm).pack(side="left", padx=10)
+        # Bind keys with general key press/release handlers
+        self._manual_popup.bind("<KeyPress>", self._on_manual_key_press)
+        self._manual_popup.bind("<KeyRelease>", self._on_manual_key_release)
+        # A key released after focus leaves the popup is never seen here, so
+        # treat losing focus as a release; otherwise the keepalive would
+        # keep the jog running indefinitely
+        self._manual_popup.bind("<FocusOut>", self._on_manual_button_release)
         
-        # Set focus to the entry field
-        target_entry.focus_set()
+        # Bind buttons with specific handlers
+        left_button.bind("<ButtonPress>", lambda e: self._on_manual_button_press(CMD_MANUAL_CW_START, "left"))
+        left_button.bind("<ButtonRelease>", self._on_manual_button_release)
+        
+        right_button.bind("<ButtonPress>", lambda e: self._on_manual_button_press(CMD_MANUAL_CCW_START, "right"))
+        right_button.bind("<ButtonRelease>", self._on_manual_button_release)
+        
+        # Add close button
+        ctk.CTkButton(self._manual_popup, text="Close", 
+                    command=self._close_manual_popup).pack(pady=10)
+        
+        # Set close protocol
+        self._manual_popup.protocol("WM_DELETE_WINDOW", self._close_manual_popup)
+
+    # Key press handler: starts a jog whose START is re-sent every
+    # MANUAL_KEEPALIVE_MS while held; the Arduino stops on MANUAL:STOP or
+    # by itself if no START arrives within its JOG_TIMEOUT_MS (300 ms)
+    def _on_manual_key_press(self, event):
+        is_key_pressed = self._manual_keys_pressed
+        # Set direction based on key
+        if event.keysym == "Left" and not is_key_pressed["left"]:
+            is_key_pressed["left"] = True
+            is_key_pressed["right"] = False  # Ensure other key is cleared
+            self._start_manual_jog(CMD_MANUAL_CCW_START)
+            
+        elif event.keysym == "Right" and not is_key_pressed["right"]:
+            is_key_pressed["right"] = True
+            is_key_pressed["left"] = False  # Ensure other key is cleared
+            self._start_manual_jog(CMD_MANUAL_CW_START)
+
+    def _on_manual_key_release(self, event):
+        is_key_pressed = self._manual_keys_pressed
+        if event.keysym == "Left":
+            is_key_pressed["left"] = False
+            
+        elif event.keysym == "Right":
+            is_key_pressed["right"] = False
+        
+        # If both keys are released, stop movement
+        if not (is_key_pressed["left"] or is_key_pressed["right"]):
+            self._stop_manual_jog()
+
+    def _on_manual_button_press(self, command, key):
+        for other_key in self._manual_keys_pressed:
+            self._manual_keys_pressed[other_key] = other_key == key
+        
+        self._start_manual_jog(command)
+
+    def _on_manual_button_release(self, event=None):
+        for key in self._manual_keys_pressed:
+            self._manual_keys_pressed[key] = False
+        
+        self._stop_manual_jog()
+
+    def _start_manual_jog(self, command):
+        """Send a jog START and keep re-sending it until _stop_manual_jog"""
+        self._cancel_manual_keepalive()
+        self._manual_jog_command = command
+        self._send_manual_keepalive()
+
+    def _send_manual_keepalive(self):
+        self.controller.send_bytes(self._manual_jog_command)
+        self._manual_jog_timer = self._manual_popup.after(MANUAL_KEEPALIVE_MS,
+                                                          self._send_manual_keepalive)
+
+    def _cancel_manual_keepalive(self):
+        if self._manual_jog_timer:
+            self._manual_popup.after_cancel(self._manual_jog_timer)
+            self._manual_jog_timer = None
+        self._manual_jog_command = None
+
+    def _stop_manual_jog(self):
+        self._cancel_manual_keepalive()
+        self.controller.send_bytes(CMD_MANUAL_STOP)
+
+    def _close_manual_popup(self):
+        # MANUAL:COMPLETE also stops any movement on the Arduino
+        self._cancel_manual_keepalive()
+        self.controller.send_bytes(CMD_MANUAL_COMPLETE)
+        self._hide_dialog(self._manual_popup)
+        self.log_msg("-> Exited Manual Control mode")
+        self.controller.go_rest()
 
     def on_manual(self):
         # Check if system is calibrated
@@ -623,135 +922,11 @@ class MotorApp(ctk.CTk, Observer):
             ctk.CTkButton(calib_warning, text="OK", command=close_warning).pack(pady=10)
             return
         
-        # Create popup window
-        manual_popup = ctk.CTkToplevel(self)
-        manual_popup.title("Manual Control")
-        manual_popup.geometry("300x180")
-        manual_popup.transient(self)
-        manual_popup.grab_set()
-        
-        ctk.CTkLabel(manual_popup, 
-                    text="Hold arrow keys to move motor",
-                    font=("Arial", 14)).pack(pady=10)
-        
-        # Left and right buttons
-        button_frame = ctk.CTkFrame(manual_popup)
-        button_frame.pack(pady=10)
-        
-        left_button = ctk.CTkButton(button_frame, text="◄", width=40, height=40)
-        left_button.pack(side="left", padx=10)
-        
-        right_button = ctk.CTkButton(button_frame, text="►", width=40, height=40)
-        right_button.pack(side="left", padx=10)
-        
-        # For key tracking
-        is_key_pressed = {"left": False, "right": False}
-        active_command = None
-        repeat_timer = None
-        
-        # Move motor function
-        def move_motor():
-            nonlocal repeat_timer
-            if active_command:
-                self.controller.send_command(active_command)
-                repeat_timer = manual_popup.after(10, move_motor)  # 5ms repeat for faster response
-        
-        # Key press handler
-        def on_key_press(event):
-            nonlocal active_command, repeat_timer
-            
-            # Cancel any existing movement
-            if repeat_timer:
-                manual_popup.after_cancel(repeat_timer)
-                repeat_timer = None
-            
-            # Set direction based on key
-            if event.keysym == "Left" and not is_key_pressed["left"]:
-                is_key_pressed["left"] = True
-                is_key_pressed["right"] = False  # Ensure other key is cleared
-                active_command = "MANUAL:CCW"
-                move_motor()  # Start movement
-                
-            elif event.keysym == "Right" and not is_key_pressed["right"]:
-                is_key_pressed["right"] = True
-                is_key_pressed["left"] = False  # Ensure other key is cleared
-                active_command = "MANUAL:CW"
-                move_motor()  # Start movement
-        
-        # Key release handler
-        def on_key_release(event):
-            nonlocal active_command, repeat_timer
-            
-            if event.keysym == "Left":
-                is_key_pressed["left"] = False
-                
-            elif event.keysym == "Right":
-                is_key_pressed["right"] = False
-            
-            # If both keys are released, stop movement
-            if not (is_key_pressed["left"] or is_key_pressed["right"]):
-                active_command = None
-                if repeat_timer:
-                    manual_popup.after_cancel(repeat_timer)
-                    repeat_timer = None
-                self.controller.send_command("MANUAL:STOP")
-        
-        # Handler functions for button presses
-        def start_button_command(command, key):
-            nonlocal is_key_pressed
-            is_key_pressed[key] = True
-            for other_key in is_key_pressed:
-                if other_key != key:
-                    is_key_pressed[other_key] = False
-                    
-            nonlocal active_command, repeat_timer
-            if repeat_timer:
-                manual_popup.after_cancel(repeat_timer)
-            
-            active_command = command
-            move_motor()
-        
-        def stop_button_command():
-            nonlocal is_key_pressed, active_command, repeat_timer
-            for key in is_key_pressed:
-                is_key_pressed[key] = False
-                
-            active_command = None
-            if repeat_timer:
-                manual_popup.after_cancel(repeat_timer)
-                repeat_timer = None
-            
-            self.controller.send_command("MANUAL:STOP")
-        
-        # Bind keys with general key press/release handlers
-        manual_popup.bind("<KeyPress>", on_key_press)
-        manual_popup.bind("<KeyRelease>", on_key_release)
-        
-        # Bind buttons with specific handlers
-        left_button.bind("<ButtonPress>", lambda e: start_button_command("MANUAL:CW", "left"))
-        left_button.bind("<ButtonRelease>", lambda e: stop_button_command())
-        
-        right_button.bind("<ButtonPress>", lambda e: start_button_command("MANUAL:CCW", "right"))
-        right_button.bind("<ButtonRelease>", lambda e: stop_button_command())
-        
-        def close_popup():
-            nonlocal repeat_timer
-            # Stop any movement
-            if repeat_timer:
-                manual_popup.after_cancel(repeat_timer)
-            
-            self.controller.send_command("MANUAL:COMPLETE")
-            manual_popup.destroy()
-            self.log_msg("-> Exited Manual Control mode")
-            self.controller.go_rest()
-        
-        # Add close button
-        ctk.CTkButton(manual_popup, text="Close", 
-                    command=close_popup).pack(pady=10)
-        
-        # Set close protocol
-        manual_popup.protocol("WM_DELETE_WINDOW", close_popup)
-        manual_popup.focus_set()  # Important to capture key events
+        # Show the popup with no keys held
+        for key in self._manual_keys_pressed:
+            self._manual_keys_pressed[key] = False
+        self._show_dialog(self._manual_popup)
+        self._manual_popup.focus_set()  # Important to capture key events
         
         # Log entry to manual mode
         self.log_msg("-> Entered Manual Control mode")